@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from datetime import date
+from functools import cache
 import json
 import xml.etree.ElementTree as ET
 
@@ -10,7 +11,7 @@ from app.core.config import settings
 ALLOWED_APPROVAL_TYPES = {"email_send_batch", "calendar_invite", "purchase_intent"}
 
 
-@dataclass
+@dataclass(slots=True)
 class PlanOutput:
     date: str
     primary_focus: str
@@ -23,6 +24,7 @@ class PlanOutput:
     assumptions: list[str]
 
 
+@cache
 def _tool_schema() -> list[dict]:
     return [
         {
@@ -121,11 +123,17 @@ def _plan_from_tool_args(args: dict) -> PlanOutput:
     )
 
 
+@cache
+def _anthropic_client(api_key: str) -> Anthropic:
+    # One client per key so worker runs share its HTTP connection pool.
+    return Anthropic(api_key=api_key)
+
+
 def _llm_tool_call_plan(briefing_packet: str) -> PlanOutput:
     if not settings.anthropic_api_key:
         raise ValueError("ANTHROPIC_API_KEY missing")
 
-    client = Anthropic(api_key=settings.anthropic_api_key)
+    client = _anthropic_client(settings.anthropic_api_key)
     completion = client.messages.create(
         model=settings.anthropic_model,
         max_tokens=1024,